@@ -16,6 +16,16 @@ class Settings(BaseSettings):
     # MongoDB Configuration
     mongodb_url: str = "MONGODB_URL"
     database_name: str = "Polaris-Investor"
+
+    # MongoDB connection pool tuning — an async driver multiplexes requests
+    # over few connections, so a modest pool with idle pruning beats the
+    # driver default of 100
+    mongodb_max_pool_size: int = 50
+    mongodb_min_pool_size: int = 5
+    mongodb_max_idle_time_ms: int = 30000
+    mongodb_server_selection_timeout_ms: int = 5000
+    mongodb_socket_timeout_ms: int = 10000
+    mongodb_compressors: str = "zstd,zlib"
     
     allowed_file_type: List[str] = ["application/pdf"]
     cors_origins: List[str] = ["http://localhost:3000", "http://localhost:3001"]
@@ -28,6 +38,17 @@ class Settings(BaseSettings):
     # Pagination defaults
     default_page_size: int = 20
     max_page_size: int = 100
+
+    # Micro-batching of concurrent pitch analyses into one LLM request
+    analysis_batching_enabled: bool = True
+    analysis_batch_max: int = 8
+    analysis_batch_wait_ms: int = 50
+
+    # Semantic cache for pitch analyses (requires sentence-transformers)
+    semantic_cache_enabled: bool = True
+    semantic_cache_model: str = "all-MiniLM-L6-v2"
+    semantic_cache_threshold: float = 0.92
+    semantic_cache_max_entries: int = 10000
     
     class Config:
         env_file = ".env"
@@ -14,7 +14,17 @@ database = Database()
 async def connect_to_mongo():
     """Create database connection"""
     try:
-        database.client = AsyncIOMotorClient(settings.mongodb_url)  # Fixed attribute name
+        database.client = AsyncIOMotorClient(
+            settings.mongodb_url,
+            maxPoolSize=settings.mongodb_max_pool_size,
+            minPoolSize=settings.mongodb_min_pool_size,
+            maxIdleTimeMS=settings.mongodb_max_idle_time_ms,
+            serverSelectionTimeoutMS=settings.mongodb_server_selection_timeout_ms,
+            socketTimeoutMS=settings.mongodb_socket_timeout_ms,
+            compressors=settings.mongodb_compressors,
+            retryWrites=True,
+            uuidRepresentation="standard"
+        )
         database.db = database.client[settings.database_name]
         logger.info("Connected to MongoDB")
     except Exception as e:
@@ -0,0 +1,113 @@
+from pydantic import BaseModel, Field, field_validator
+from pydantic.json_schema import GetJsonSchemaHandler, JsonSchemaValue
+from typing import List, Optional, Any
+from datetime import datetime
+from bson import ObjectId
+
+
+class PyObjectId(ObjectId):
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, v: Any) -> ObjectId:
+        if not ObjectId.is_valid(v):
+            raise ValueError("Invalid objectid")
+        return ObjectId(v)
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, core_schema: Any, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        # Generate base schema
+        schema = handler(core_schema)
+        # Modify to show as string instead of ObjectId
+        schema.update(type="string")
+        return schema
+
+
+class InvestorBase(BaseModel):
+    """Base model for investor data"""
+    Investor_name: str = Field(..., description="Investor name")
+    Investor_type: Optional[str] = Field(None, description="Investor type (VC, Angel, PE, etc.)")
+    Global_HQ: Optional[str] = Field(None, description="Location/Country")
+    Stage_of_investment: Optional[str] = Field(None, description="Investment stage (Seed, Series A, etc.)")
+    Website: Optional[str] = Field(None, description="Website URL")
+
+    model_config = {
+        "arbitrary_types_allowed": True
+    }
+
+
+class InvestorInDB(InvestorBase):
+    """Investor model for database storage"""
+    id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+    model_config = {
+        "arbitrary_types_allowed": True,
+        "populate_by_name": True
+    }
+
+
+class InvestorResponse(BaseModel):
+    """Investor model for API responses"""
+    id: str = Field(..., description="Investor ID")
+    Investor_name: str = Field(..., description="Investor name")
+    Investor_type: Optional[str] = Field(None, description="Investor type")
+    Global_HQ: Optional[str] = Field(None, description="Location/Country")
+    Stage_of_investment: Optional[str] = Field(None, description="Investment stage")
+    Website: Optional[str] = Field(None, description="Website URL")
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def validate_id(cls, v):
+        if isinstance(v, ObjectId):
+            return str(v)
+        return v
+
+    model_config = {
+        "from_attributes": True
+    }
+
+
+class InvestorListResponse(BaseModel):
+    """Response model for paginated investor list"""
+    investors: List[InvestorResponse]
+    total_count: Optional[int] = Field(None, description="Total matches; omitted unless include_total is set")
+    page: int
+    page_size: int
+    total_pages: Optional[int] = None
+    has_next: bool
+    has_prev: bool
+    next_cursor: Optional[str] = Field(None, description="Opaque cursor for fetching the next page")
+
+
+class InvestorFilters(BaseModel):
+    """Model for investor filtering parameters"""
+    search: Optional[str] = Field(None, description="Search in name, description, sectors")
+    type: Optional[str] = Field(None, description="Filter by investor type")
+    location: Optional[str] = Field(None, description="Filter by location")
+    investment_stage: Optional[str] = Field(None, description="Filter by investment stage")
+
+
+class InvestorCreate(BaseModel):
+    """Model for creating new investors"""
+    Investor_name: str = Field(..., description="Investor name")
+    Investor_type: Optional[str] = Field(None, description="Investor type")
+    Global_HQ: Optional[str] = Field(None, description="Location/Country")
+    Stage_of_investment: Optional[str] = Field(None, description="Investment stage")
+    Website: Optional[str] = Field(None, description="Website URL")
+
+
+class InvestorUpdate(BaseModel):
+    """Model for updating investors"""
+    Investor_name: Optional[str] = Field(None, description="Investor name")
+    Investor_type: Optional[str] = Field(None, description="Investor type")
+    Global_HQ: Optional[str] = Field(None, description="Location/Country")
+    Stage_of_investment: Optional[str] = Field(None, description="Investment stage")
+    Website: Optional[str] = Field(None, description="Website URL")
@@ -1,11 +1,148 @@
 from .database import get_database
 from motor.motor_asyncio import AsyncIOMotorCollection
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from .logger import logger
 import re, math
+import asyncio
+import base64
+import json
+from functools import lru_cache
 from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo.errors import BulkWriteError
 from datetime import datetime
-from .schema import InvestorInDB, InvestorResponse, InvestorFilters, InvestorListResponse
+from pydantic import TypeAdapter
+from .investor_schema import InvestorInDB, InvestorResponse, InvestorFilters, InvestorListResponse
+
+# Batch adapter so bulk validation runs once per chunk in Pydantic's core
+# instead of building a model call stack per row
+_investor_list_adapter = TypeAdapter(List[InvestorInDB])
+
+# Only pull the fields InvestorResponse actually exposes — documents may
+# grow extra fields over time and we shouldn't pay wire/decode cost for them
+_RESPONSE_PROJECTION = {field: 1 for field in InvestorResponse.model_fields if field != "id"}
+_RESPONSE_PROJECTION["_id"] = 1
+
+# Offset pagination degrades linearly with page depth; past this many skipped
+# documents clients must switch to the `after` cursor instead
+MAX_SKIP_OFFSET = 10000
+
+# Bulk inserts are streamed in fixed-size chunks with a few in flight at
+# once; small batch x limited concurrency beats one giant insert_many
+BULK_BATCH_SIZE = 1000
+BULK_MAX_CONCURRENCY = 4
+
+# Fields covered by the compound text index used for search
+SEARCH_FIELDS = ("Investor_name", "Investor_type", "Global_HQ", "Stage_of_investment")
+
+# Only indexed fields may be sorted on — arbitrary sort fields would force
+# in-memory sorts / collection scans
+SORT_WHITELIST = frozenset(SEARCH_FIELDS + ("created_at", "updated_at"))
+
+# Cursor pagination additionally needs a sort field present on every
+# document: if the page boundary document lacked it, the cursor would
+# encode null and the next page's $gt-null branch would match nothing
+CURSOR_SORT_FIELDS = frozenset(("Investor_name", "created_at", "updated_at"))
+
+# Lowercase shadow fields written alongside the originals so plain filter
+# values can use an indexed equality match instead of a regex
+LC_SHADOW_FIELDS = {
+    "Investor_type": "Investor_type_lc",
+    "Global_HQ": "Global_HQ_lc",
+    "Stage_of_investment": "Stage_of_investment_lc",
+}
+
+
+def _add_shadow_fields(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Precompute lowercase shadow fields for indexed case-insensitive filtering"""
+    for field, lc_field in LC_SHADOW_FIELDS.items():
+        value = doc.get(field)
+        if isinstance(value, str):
+            doc[lc_field] = value.lower()
+    return doc
+
+
+@lru_cache(maxsize=1024)
+def _compile_ci(pattern: str) -> re.Pattern:
+    """Compile an anchored case-insensitive prefix regex, cached across requests"""
+    return re.compile("^" + re.escape(pattern), re.IGNORECASE)
+
+
+# Characters with special meaning in a regex; values free of these can use
+# a plain equality match. Deliberately not re.escape(v) == v — that escapes
+# innocuous characters like spaces, which would push "New York" onto the
+# regex path while "Seed" gets equality semantics
+_REGEX_META_RE = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+
+def _validate_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Validate a chunk of raw investor rows in one batched Pydantic call
+
+    Falls back to per-row validation when the batch contains bad rows, so a
+    single invalid document only drops itself rather than the whole chunk.
+    """
+    try:
+        models = _investor_list_adapter.validate_python(rows)
+        dumped = _investor_list_adapter.dump_python(models, by_alias=True, exclude_unset=True)
+        return [_add_shadow_fields(doc) for doc in dumped]
+    except Exception:
+        validated = []
+        for row in rows:
+            try:
+                investor = InvestorInDB(**row)
+                validated.append(_add_shadow_fields(investor.model_dump(by_alias=True, exclude_unset=True)))
+            except Exception as e:
+                logger.warning(f"Skipping invalid investor data: {e}")
+        return validated
+
+
+def _filter_condition(field: str, value: str) -> Tuple[str, Any]:
+    """Build the fastest filter condition for a single-field value
+
+    Plain values (no regex metacharacters) become an equality match on the
+    lowercase shadow field; anything else falls back to an anchored,
+    escaped, case-insensitive prefix regex.
+    """
+    if not _REGEX_META_RE.search(value):
+        return LC_SHADOW_FIELDS[field], value.lower()
+    return field, _compile_ci(value)
+
+
+def _oid(investor_id: str) -> Optional[ObjectId]:
+    """Parse an investor id, returning None when it isn't a valid ObjectId"""
+    # ObjectId(None) would mint a brand-new id instead of failing
+    if not investor_id:
+        return None
+    try:
+        return ObjectId(investor_id)
+    except (InvalidId, TypeError):
+        return None
+
+
+def _encode_cursor(last_sort_value: Any, last_id: ObjectId) -> str:
+    """Encode the last seen (sort value, _id) pair as an opaque cursor
+
+    Datetime sort values (created_at/updated_at) are tagged so the decode
+    side can revive them as datetimes — serializing them as bare strings
+    would make the next-page query compare strings against Date fields,
+    which never matches.
+    """
+    if isinstance(last_sort_value, datetime):
+        last_sort_value = {"$date": last_sort_value.isoformat()}
+    payload = {"last_sort_value": last_sort_value, "last_id": str(last_id)}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[Any, ObjectId]:
+    """Decode an opaque cursor back into its (sort value, _id) pair"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        last_sort_value = payload["last_sort_value"]
+        if isinstance(last_sort_value, dict) and "$date" in last_sort_value:
+            last_sort_value = datetime.fromisoformat(last_sort_value["$date"])
+        return last_sort_value, ObjectId(payload["last_id"])
+    except Exception:
+        raise ValueError("Invalid pagination cursor")
 
 
 class InvestorService:
@@ -32,8 +169,8 @@ class InvestorService:
             investor = InvestorInDB(**investor_data)
             
             # Convert to dict and handle ObjectId
-            investor_dict = investor.model_dump(by_alias=True, exclude_unset=True)
-            
+            investor_dict = _add_shadow_fields(investor.model_dump(by_alias=True, exclude_unset=True))
+
             # Insert into database
             result = await collection.insert_one(investor_dict)
             logger.info(f"Created investor: {result.inserted_id}")
@@ -47,77 +184,207 @@ class InvestorService:
         """Bulk create investors from CSV data"""
         collection = await self.get_collection()
         
-        investors = []
+        # One timestamp for the whole batch instead of two clock reads per row
+        now = datetime.utcnow()
+
+        sem = asyncio.Semaphore(BULK_MAX_CONCURRENCY)
+
+        async def _insert_chunk(chunk: List[Dict[str, Any]]) -> int:
+            async with sem:
+                try:
+                    # ordered=False lets the driver pipeline writes and keeps
+                    # going past individual bad documents
+                    result = await collection.insert_many(chunk, ordered=False)
+                    return len(result.inserted_ids)
+                except BulkWriteError as e:
+                    inserted = e.details.get("nInserted", 0)
+                    logger.warning(f"Bulk insert chunk had errors; inserted {inserted}/{len(chunk)}")
+                    return inserted
+
+        def _schedule(raw_rows: List[Dict[str, Any]]):
+            validated = _validate_rows(raw_rows)
+            if validated:
+                tasks.append(asyncio.create_task(_insert_chunk(validated)))
+
+        tasks = []
+        chunk: List[Dict[str, Any]] = []
         for data in investors_data:
-            try:
-                # Add timestamps
-                data['created_at'] = datetime.utcnow()
-                data['updated_at'] = datetime.utcnow()
-                
-                # Create investor model
-                investor = InvestorInDB(**data)
-                investor_dict = investor.model_dump(by_alias=True, exclude_unset=True)
-                investors.append(investor_dict)
-                
-            except Exception as e:
-                logger.warning(f"Skipping invalid investor data: {e}")
-                continue
-        
-        if investors:
-            try:
-                result = await collection.insert_many(investors)
-                logger.info(f"Bulk created {len(result.inserted_ids)} investors")
-                return len(result.inserted_ids)
-            except Exception as e:
-                logger.error(f"Error in bulk insert: {e}")
-                raise
-        
-        return 0
+            # Add timestamps
+            data['created_at'] = now
+            data['updated_at'] = now
+            chunk.append(data)
+
+            if len(chunk) >= BULK_BATCH_SIZE:
+                _schedule(chunk)
+                chunk = []
+
+        if chunk:
+            _schedule(chunk)
+
+        if not tasks:
+            return 0
+
+        try:
+            inserted_count = sum(await asyncio.gather(*tasks))
+            logger.info(f"Bulk created {inserted_count} investors")
+            return inserted_count
+        except Exception as e:
+            logger.error(f"Error in bulk insert: {e}")
+            raise
     
+    async def create_indexes(self):
+        """Create the indexes that pagination relies on"""
+        collection = await self.get_collection()
+
+        try:
+            # Compound (sort, _id) indexes so cursor pagination is a bounded
+            # range scan on any whitelisted always-present sort field
+            await collection.create_index([("Investor_name", 1), ("_id", 1)], background=True)
+            await collection.create_index([("created_at", 1), ("_id", 1)], background=True)
+            await collection.create_index([("updated_at", 1), ("_id", 1)], background=True)
+
+            # Text index so search uses indexed token lookups instead of
+            # regex collection scans
+            await collection.create_index(
+                [(field, "text") for field in SEARCH_FIELDS],
+                background=True
+            )
+
+            # Compound (filter, sort) indexes on the original fields serve
+            # the regex fallback path (values with metacharacters)
+            await collection.create_index([("Investor_type", 1), ("Investor_name", 1)], background=True)
+            await collection.create_index([("Global_HQ", 1), ("Investor_name", 1)], background=True)
+            await collection.create_index([("Stage_of_investment", 1), ("Investor_name", 1)], background=True)
+
+            # Backfill the lowercase shadow fields on documents written
+            # before they existed — without this, shadow-field equality
+            # filters silently miss all pre-existing data. Idempotent:
+            # only touches documents still lacking the shadow field.
+            for field, lc_field in LC_SHADOW_FIELDS.items():
+                await collection.update_many(
+                    {lc_field: {"$exists": False}, field: {"$type": "string"}},
+                    [{"$set": {lc_field: {"$toLower": f"${field}"}}}]
+                )
+
+            # Compound (shadow, sort, _id) indexes for the dominant path:
+            # plain-value filters are equality matches on the shadow field,
+            # and the suffix keeps filter + default sort a range scan
+            # producing already-sorted results — no in-memory SORT stage
+            for lc_field in LC_SHADOW_FIELDS.values():
+                await collection.create_index(
+                    [(lc_field, 1), ("Investor_name", 1), ("_id", 1)],
+                    background=True
+                )
+
+            logger.info("Investor indexes created")
+        except Exception as e:
+            logger.error(f"Error creating investor indexes: {e}")
+
     async def get_investors(
-        self, 
+        self,
         page: int = 1,
         page_size: int = 20,
         filters: Optional[InvestorFilters] = None,
         sort_by: str = 'Investor_name',
         sort_order: int = 1,
+        after: Optional[str] = None,
+        include_total: bool = False,
     ) -> InvestorListResponse:
         """Get paginated list of investors with filters"""
         collection = await self.get_collection()
-        
+
+        if sort_by not in SORT_WHITELIST:
+            raise ValueError(
+                f"Cannot sort by '{sort_by}'; allowed fields: {', '.join(sorted(SORT_WHITELIST))}"
+            )
+
         try:
             # Build query
             query: Dict[str, Any] = {}
             if filters:
                 if filters.search:
-                    search_regex = re.compile(filters.search, re.IGNORECASE)
-                    query["$or"] = [
-                        {"Investor_name": search_regex},
-                        {"Investor_type": search_regex},
-                        {"Global_HQ": search_regex},
-                        {"Stage_of_investment": search_regex}
-                    ]
-                    
+                    # $text uses the compound text index; an unanchored
+                    # case-insensitive $or regex would scan the collection
+                    query["$text"] = {"$search": filters.search}
+
                 if filters.type:
-                    query["Investor_type"] = re.compile(filters.type, re.IGNORECASE)
-                    
+                    key, condition = _filter_condition("Investor_type", filters.type)
+                    query[key] = condition
+
                 if filters.location:
-                    query["Global_HQ"] = re.compile(filters.location, re.IGNORECASE)
-            
+                    key, condition = _filter_condition("Global_HQ", filters.location)
+                    query[key] = condition
+
                 if filters.investment_stage:
-                    query["Stage_of_investment"] = re.compile(filters.investment_stage, re.IGNORECASE)
-            
-            # Count total documents matching the query
-            total_count = await collection.count_documents(query)
-            
-            # Calculate pagination
-            total_pages = math.ceil(total_count / page_size) if page_size > 0 else 1
-            skip = (page - 1) * page_size
-            
-            # Execute the query with pagination and sorting
-            cursor = collection.find(query).sort(sort_by, sort_order).skip(skip).limit(page_size)
-            documents = await cursor.to_list(length=page_size)
+                    key, condition = _filter_condition("Stage_of_investment", filters.investment_stage)
+                    query[key] = condition
             
+            # Counting is expensive: count_documents scans the collection for
+            # non-trivial filters, so only pay for it when explicitly asked.
+            # Unfiltered totals come from an O(1) metadata read instead.
+            if not query:
+                total_count = await collection.estimated_document_count()
+            elif include_total:
+                total_count = await collection.count_documents(query)
+            else:
+                total_count = None
+
+            total_pages = (
+                math.ceil(total_count / page_size)
+                if total_count is not None and page_size > 0 else None
+            )
+
+            # Fetch one extra document to detect whether a next page exists
+            # without a count
+            fetch_size = page_size + 1
+
+            if after:
+                if sort_by not in CURSOR_SORT_FIELDS:
+                    raise ValueError(
+                        f"Cursor pagination cannot sort by '{sort_by}'; "
+                        f"allowed fields: {', '.join(sorted(CURSOR_SORT_FIELDS))}"
+                    )
+                # Cursor pagination: a bounded index range scan on
+                # (sort_by, _id), independent of page depth
+                last_sort_value, last_id = _decode_cursor(after)
+                comparator = "$gt" if sort_order == 1 else "$lt"
+                cursor_query = {
+                    "$or": [
+                        {sort_by: {comparator: last_sort_value}},
+                        {sort_by: last_sort_value, "_id": {comparator: last_id}}
+                    ]
+                }
+                find_query = {"$and": [query, cursor_query]} if query else cursor_query
+                cursor = collection.find(find_query, _RESPONSE_PROJECTION) \
+                    .sort([(sort_by, sort_order), ("_id", sort_order)]) \
+                    .limit(fetch_size)
+            else:
+                # Legacy offset pagination, kept for shallow pages only —
+                # skip cost grows linearly with page depth
+                skip = (page - 1) * page_size
+                if skip > MAX_SKIP_OFFSET:
+                    raise ValueError(
+                        f"Page offset too large (max {MAX_SKIP_OFFSET} documents); "
+                        "use the 'after' cursor for deep pagination"
+                    )
+                cursor = collection.find(query, _RESPONSE_PROJECTION) \
+                    .sort([(sort_by, sort_order), ("_id", sort_order)]) \
+                    .skip(skip).limit(fetch_size)
+
+            documents = await cursor.to_list(length=fetch_size)
+
+            # The overflow document only signals that another page exists
+            has_next = len(documents) > page_size
+            documents = documents[:page_size]
+
+            # Build the cursor for the next page from the last returned
+            # document (before _id is stripped below); only offered for
+            # sort fields that support cursor continuation
+            next_cursor = None
+            if has_next and documents and sort_by in CURSOR_SORT_FIELDS:
+                last_doc = documents[-1]
+                next_cursor = _encode_cursor(last_doc.get(sort_by), last_doc["_id"])
+
             # Convert documents to response models
             investors = []
             for doc in documents:
@@ -143,8 +410,10 @@ class InvestorService:
                 page=page,
                 page_size=page_size,
                 total_pages=total_pages,
-                has_next=page < total_pages,
-                has_prev=page > 1
+                has_next=has_next,
+                # A cursor only exists if a previous page produced it
+                has_prev=page > 1 or after is not None,
+                next_cursor=next_cursor
             )
             
         except Exception as e:
@@ -155,13 +424,14 @@ class InvestorService:
         """Get investor by ID"""
         collection = await self.get_collection()
         
+        # Parse the id once and reuse the ObjectId
+        oid = _oid(investor_id)
+        if oid is None:
+            logger.warning(f"Invalid ObjectId: {investor_id}")
+            return None
+
         try:
-            # Validate ObjectId
-            if not ObjectId.is_valid(investor_id):
-                logger.warning(f"Invalid ObjectId: {investor_id}")
-                return None
-                
-            doc = await collection.find_one({"_id": ObjectId(investor_id)})
+            doc = await collection.find_one({"_id": oid}, _RESPONSE_PROJECTION)
             if doc:
                 # Convert ObjectId to string
                 doc["id"] = str(doc["_id"])
@@ -181,20 +451,26 @@ class InvestorService:
         """Update investor"""
         collection = await self.get_collection()
         
+        # Parse the id once and reuse the ObjectId
+        oid = _oid(investor_id)
+        if oid is None:
+            logger.warning(f"Invalid ObjectId: {investor_id}")
+            return False
+
         try:
-            # Validate ObjectId
-            if not ObjectId.is_valid(investor_id):
-                logger.warning(f"Invalid ObjectId: {investor_id}")
-                return False
-            
             # Add updated timestamp
             update_data["updated_at"] = datetime.utcnow()
-            
+
             # Remove any None values
             update_data = {k: v for k, v in update_data.items() if v is not None}
-            
+
+            # Keep the lowercase shadow fields in sync with the new values;
+            # None values were just dropped (this path never removes a
+            # field), so no $unset counterpart is needed
+            _add_shadow_fields(update_data)
+
             result = await collection.update_one(
-                {"_id": ObjectId(investor_id)},
+                {"_id": oid},
                 {"$set": update_data}
             )
             
@@ -214,13 +490,14 @@ class InvestorService:
         """Delete investor"""
         collection = await self.get_collection()
         
+        # Parse the id once and reuse the ObjectId
+        oid = _oid(investor_id)
+        if oid is None:
+            logger.warning(f"Invalid ObjectId: {investor_id}")
+            return False
+
         try:
-            # Validate ObjectId
-            if not ObjectId.is_valid(investor_id):
-                logger.warning(f"Invalid ObjectId: {investor_id}")
-                return False
-                
-            result = await collection.delete_one({"_id": ObjectId(investor_id)})
+            result = await collection.delete_one({"_id": oid})
             
             success = result.deleted_count > 0
             if success:
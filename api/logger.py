@@ -1,36 +1,56 @@
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 from .config import settings
 
+# Skip collecting thread/process info when building log records; nothing in
+# our format strings uses it
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 
 
 def setup_logger():
-    """Setup application logger with file and console handlers"""
-    
+    """Setup application logger with non-blocking file and console handlers"""
+
     logger = logging.getLogger("pitch_analyzer")
     logger.setLevel(getattr(logging, settings.log_level.upper()))
-    
+
     logger.handlers.clear()
-    
-    formatter = logging.Formatter(
+
+    # The rich format (funcName/lineno) is only worth paying for in the
+    # file log used for postmortems; the console gets a lean one
+    file_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
     )
-    
+    console_formatter = logging.Formatter('%(asctime)s %(levelname)s %(message)s')
+
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
+    console_handler.setFormatter(console_formatter)
+
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
-    
+
     file_handler = logging.FileHandler(
         log_dir / f"{datetime.now().strftime('%Y-%m-%d')}_{settings.log_file}"
     )
-    
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    file_handler.setFormatter(file_formatter)
+
+    # Log calls only enqueue the record; the real handlers run on a
+    # background thread so request handling never blocks on disk writes
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # Records are fully handled by the listener; don't re-emit via root
+    logger.propagate = False
     return logger
 
 logger = setup_logger()
\ No newline at end of file
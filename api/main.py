@@ -1,23 +1,29 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File, Request, Depends, Query
 from typing import List, Optional
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
+from starlette.middleware.base import BaseHTTPMiddleware
 from prometheus_client import Counter, Histogram, generate_latest, CONTENT_TYPE_LATEST
+from cachetools import TTLCache
+import asyncio
+import hashlib
+import logging
 import time
 import traceback
 from datetime import datetime
 from .config import settings
 from .logger import logger
 from .exceptions import PDFProcessingError, PitchAnalyzerException, ValidationError, RateLimitError, AnalysisError
-from .pitch_analyzer import pitch_analyzer, PitchAnalyzer, PitchFeedback
-from .pdf_util import PDFProcessingError, PDFProcessor
-from .schema import PitchFeedback, PitchRequest, AnalysisResponse, ErrorResponse, InvestorListResponse, InvestorResponse, InvestorInDB, InvestorFilters, InvestorBase
+from .pitch_analyzer import get_pitch_analyzer, close_http_client
+from .pdf_util import PDFProcessingError, PDFProcessor, start_pdf_pool, stop_pdf_pool
+from .schema import PitchFeedback, PitchRequest, AnalysisResponse, ErrorResponse
+from .investor_schema import InvestorListResponse, InvestorResponse, InvestorInDB, InvestorFilters, InvestorBase
 from .validators import InputValidator
 from .investor_service import investor_service
-from .database import connect_to_mongo, close_mongo_connection
+from .database import connect_to_mongo, close_mongo_connection, database
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -25,7 +31,8 @@ app = FastAPI(
     description="Robust AI-powered pitch deck analysis and Investor info service",
     version="2.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Initialize rate limiter
@@ -42,6 +49,51 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Upload streaming: read in 64 KB chunks, spill to disk past 2 MB
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Content-addressed caches: identical pitch text or PDF bytes skip the
+# LLM round-trip (and the PDF parse) entirely. Note: per-process only —
+# back with Redis for multi-worker deployments.
+_analysis_cache: TTLCache = TTLCache(maxsize=512, ttl=3600)
+_pdf_text_cache: TTLCache = TTLCache(maxsize=256, ttl=3600)
+
+
+def _content_key(content: bytes) -> str:
+    """Content hash used to key the analysis and PDF-text caches"""
+    return hashlib.sha256(content).hexdigest()
+
+
+async def _read_upload(file: UploadFile) -> bytes:
+    """Read an upload in chunks, aborting as soon as the size cap is crossed
+
+    The validators and PDF extractors all take the bytes, so the upload
+    ends up in memory either way; the win over UploadFile.read() is that
+    an oversized body is rejected after max_file_size bytes instead of
+    being buffered in full first.
+    """
+    buffer = bytearray()
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        buffer += chunk
+        if len(buffer) > settings.max_file_size:
+            raise ValidationError(
+                f"File too large. Maximum size: {settings.max_file_size / (1024*1024):.1f}MB"
+            )
+    return bytes(buffer)
+
+
+def _build_feedback(result: dict) -> PitchFeedback:
+    """Build PitchFeedback from the analyzer's already-validated output
+
+    The analyzer pipeline has validated this dict already, so
+    model_construct skips a second full validation pass; anything
+    unexpected falls back to normal validation.
+    """
+    try:
+        return PitchFeedback.model_construct(**result)
+    except Exception:
+        return PitchFeedback.model_validate(result)
+
 # Metrics
 REQUEST_COUNT = Counter('http_requests_total', 'Total HTTP requests', ['method', 'endpoint', 'status'])
 REQUEST_DURATION = Histogram('http_request_duration_seconds', 'HTTP request duration')
@@ -49,46 +101,64 @@ ANALYSIS_COUNT = Counter('pitch_analyses_total', 'Total pitch analyses', ['type'
 PDF_PROCESSING_DURATION = Histogram('pdf_processing_duration_seconds', 'PDF processing duration')
 
 # Middleware for metrics and logging
-@app.middleware("http")
-async def add_metrics_and_logging(request: Request, call_next):
-    start_time = time.time()
-    
-    # Log request
-    logger.info(f"Incoming request: {request.method} {request.url.path}")
-    
-    try:
-        response = await call_next(request)
-        duration = time.time() - start_time
-        
+class MetricsLoggingMiddleware(BaseHTTPMiddleware):
+    """Record request metrics and logs with monotonic timing"""
+
+    @staticmethod
+    def _endpoint_label(request: Request) -> str:
+        # Use the route template so /investors/{investor_id} stays one
+        # Prometheus label instead of one per id
+        route = request.scope.get("route")
+        return route.path if route else request.url.path
+
+    async def dispatch(self, request: Request, call_next):
+        start = time.perf_counter()
+
+        # Skip f-string building entirely when INFO logging is off
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(f"Incoming request: {request.method} {request.url.path}")
+
+        try:
+            response = await call_next(request)
+        except Exception as e:
+            duration = time.perf_counter() - start
+            logger.error(f"Request failed: {request.method} {request.url.path} - {str(e)} - {duration:.3f}s")
+            REQUEST_COUNT.labels(
+                method=request.method,
+                endpoint=self._endpoint_label(request),
+                status=500
+            ).inc()
+            raise
+
+        duration = time.perf_counter() - start
+
         # Record metrics
         REQUEST_DURATION.observe(duration)
         REQUEST_COUNT.labels(
             method=request.method,
-            endpoint=request.url.path,
+            endpoint=self._endpoint_label(request),
             status=response.status_code
         ).inc()
-        
-        logger.info(f"Request completed: {request.method} {request.url.path} - {response.status_code} - {duration:.3f}s")
-        
+
+        if log_info:
+            logger.info(f"Request completed: {request.method} {request.url.path} - {response.status_code} - {duration:.3f}s")
+
         return response
-        
-    except Exception as e:
-        duration = time.time() - start_time
-        logger.error(f"Request failed: {request.method} {request.url.path} - {str(e)} - {duration:.3f}s")
-        REQUEST_COUNT.labels(
-            method=request.method,
-            endpoint=request.url.path,
-            status=500
-        ).inc()
-        raise
-    
+
+app.add_middleware(MetricsLoggingMiddleware)
+
 @app.on_event("startup")
 async def startup_db_client():
     await connect_to_mongo()
+    await investor_service.create_indexes()
+    start_pdf_pool()
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
     await close_mongo_connection()
+    stop_pdf_pool()
+    await close_http_client()
 
 # Exception handlers
 @app.exception_handler(ValidationError)
@@ -99,7 +169,7 @@ async def validation_exception_handler(request: Request, exc: ValidationError):
         content=ErrorResponse(
             error_type="ValidationError",
             message=str(exc)
-        ).dict()
+        ).model_dump(mode="json")
     )
 
 @app.exception_handler(PDFProcessingError)
@@ -110,7 +180,7 @@ async def pdf_processing_exception_handler(request: Request, exc: PDFProcessingE
         content=ErrorResponse(
             error_type="PDFProcessingError",
             message=str(exc)
-        ).dict()
+        ).model_dump(mode="json")
     )
 
 @app.exception_handler(AnalysisError)
@@ -121,7 +191,7 @@ async def analysis_exception_handler(request: Request, exc: AnalysisError):
         content=ErrorResponse(
             error_type="AnalysisError",
             message="Analysis service temporarily unavailable. Please try again later."
-        ).dict()
+        ).model_dump(mode="json")
     )
 
 @app.exception_handler(Exception)
@@ -132,33 +202,43 @@ async def general_exception_handler(request: Request, exc: Exception):
         content=ErrorResponse(
             error_type="InternalServerError",
             message="An unexpected error occurred. Please try again later."
-        ).dict()
+        ).model_dump(mode="json")
     )
 
 # Health check endpoint
 @app.get("/health")
-async def health_check():
+async def health_check(deep: bool = Query(False, description="Also probe the LLM with a live call")):
     """Health check endpoint"""
+    # Shallow DB check
     try:
-        # Test AI service (simple call)
-        test_result = await pitch_analyzer.llm.ainvoke("test")
-        ai_status = "healthy"
+        await database.client.admin.command("ping")
+        db_status = "healthy"
     except Exception as e:
-        logger.warning(f"AI service health check failed: {e}")
-        ai_status = "unhealthy"
-    
-    # # Test cache
-    # cache_status = "healthy" if cache_manager.redis_client else "disabled"
-    
-    # return {
-    #     "status": "healthy",
-    #     "timestamp": datetime.utcnow().isoformat(),
-    #     "version": "2.0.0",
-    #     "services": {
-    #         "ai_service": ai_status,
-    #         "cache": cache_status
-    #     }
-    # }
+        logger.warning(f"Database health check failed: {e}")
+        db_status = "unhealthy"
+
+    # Config-level AI check; a live LLM probe costs tokens and real
+    # latency, so it only runs when explicitly requested
+    ai_status = "configured" if settings.OPENAI_API_KEY else "unconfigured"
+    if deep:
+        try:
+            await asyncio.wait_for(get_pitch_analyzer().llm.ainvoke("ping"), timeout=2.0)
+            ai_status = "healthy"
+        except Exception as e:
+            logger.warning(f"AI service health check failed: {e}")
+            ai_status = "unhealthy"
+
+    healthy = db_status == "healthy" and ai_status not in ("unhealthy", "unconfigured")
+
+    return {
+        "status": "healthy" if healthy else "degraded",
+        "timestamp": datetime.utcnow().isoformat(),
+        "version": "2.0.0",
+        "services": {
+            "database": db_status,
+            "ai_service": ai_status
+        }
+    }
 
 # Metrics endpoint
 @app.get("/metrics")
@@ -177,18 +257,31 @@ async def analyze_pitch_text(request: Request, data: PitchRequest):
         # Validate input
         validated_pitch = InputValidator.validate_pitch_content(data.pitch)
         logger.info(f"Starting text pitch analysis - Length: {len(validated_pitch)} chars")
-        
+
+        # Serve identical pitches from cache
+        cache_key = _content_key(validated_pitch.encode())
+        cached = _analysis_cache.get(cache_key)
+        if cached is not None:
+            ANALYSIS_COUNT.labels(type="text", status="success").inc()
+            return AnalysisResponse(
+                status="success",
+                analysis=_build_feedback(cached),
+                cache_hit=True,
+                processing_time=round(time.time() - start_time, 2)
+            )
+
         # Analyze pitch
-        result = await pitch_analyzer.analyze_pitch(validated_pitch)
-        
+        result = await get_pitch_analyzer().analyze_pitch(validated_pitch)
+        _analysis_cache[cache_key] = result
+
         # Record metrics
         ANALYSIS_COUNT.labels(type="text", status="success").inc()
-        
+
         processing_time = round(time.time() - start_time, 2)
-        
+
         return AnalysisResponse(
             status="success",
-            analysis=PitchFeedback(**result),
+            analysis=_build_feedback(result),
             processing_time=processing_time
         )
         
@@ -207,34 +300,51 @@ async def analyze_pitch_pdf(request: Request, file: UploadFile = File(...)):
     start_time = time.time()
     
     try:
-        # Read and validate file
-        file_content = await file.read()
+        # Stream and validate file
+        file_content = await _read_upload(file)
         InputValidator.validate_file(file_content, file.filename or "unknown.pdf")
         
         logger.info(f"Starting PDF pitch analysis - File: {file.filename}, Size: {len(file_content)} bytes")
-        
-        # Extract text from PDF
-        pdf_start_time = time.time()
-        extracted_text = await PDFProcessor.extract_text_from_pdf(file_content, file.filename)
-        pdf_processing_time = time.time() - pdf_start_time
-        
-        PDF_PROCESSING_DURATION.observe(pdf_processing_time)
-        logger.info(f"PDF text extraction completed in {pdf_processing_time:.2f}s - Extracted {len(extracted_text)} characters")
-        
+
+        # Serve byte-identical PDFs from cache
+        file_key = _content_key(file_content)
+        cached = _analysis_cache.get(file_key)
+        if cached is not None:
+            ANALYSIS_COUNT.labels(type="pdf", status="success").inc()
+            return AnalysisResponse(
+                status="success",
+                analysis=_build_feedback(cached),
+                cache_hit=True,
+                processing_time=round(time.time() - start_time, 2)
+            )
+
+        # Extract text from PDF (reusing previously extracted text for
+        # identical bytes)
+        extracted_text = _pdf_text_cache.get(file_key)
+        if extracted_text is None:
+            pdf_start_time = time.time()
+            extracted_text = await PDFProcessor.extract_text_from_pdf(file_content, file.filename)
+            pdf_processing_time = time.time() - pdf_start_time
+
+            PDF_PROCESSING_DURATION.observe(pdf_processing_time)
+            logger.info(f"PDF text extraction completed in {pdf_processing_time:.2f}s - Extracted {len(extracted_text)} characters")
+            _pdf_text_cache[file_key] = extracted_text
+
         # Validate extracted text
         validated_text = InputValidator.validate_pitch_content(extracted_text)
-        
+
         # Analyze pitch
-        result = await pitch_analyzer.analyze_pitch(validated_text)
-        
+        result = await get_pitch_analyzer().analyze_pitch(validated_text)
+        _analysis_cache[file_key] = result
+
         # Record metrics
         ANALYSIS_COUNT.labels(type="pdf", status="success").inc()
-        
+
         processing_time = round(time.time() - start_time, 2)
-        
+
         return AnalysisResponse(
             status="success",
-            analysis=PitchFeedback(**result),
+            analysis=_build_feedback(result),
             processing_time=processing_time
         )
         
@@ -251,12 +361,14 @@ async def analyze_pitch_pdf(request: Request, file: UploadFile = File(...)):
 async def get_investors(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Number of items per page"),
+    after: Optional[str] = Query(None, description="Opaque cursor from a previous page; preferred over page for deep pagination"),
     search: Optional[str] = Query(None, description="Search in name, description, sectors"),
     type: Optional[str] = Query(None, description="Filter by investor type"),
     location: Optional[str] = Query(None, description="Filter by location"),
     investment_stage: Optional[str] = Query(None, description="Filter by investment stage"),
     sort_by: str = Query("Investor_name", description="Sort field"),  # Updated default
-    sort_order: str = Query("asc", regex="^(asc|desc)$", description="Sort order")
+    sort_order: str = Query("asc", regex="^(asc|desc)$", description="Sort order"),
+    include_total: bool = Query(False, description="Compute exact total count for filtered queries (slower)")
 ):
     """Get investors with pagination and filters"""
     try:
@@ -274,11 +386,15 @@ async def get_investors(
             page_size=page_size,
             filters=filters,
             sort_by=sort_by,
-            sort_order=sort_order_int
+            sort_order=sort_order_int,
+            after=after,
+            include_total=include_total
         )
-        
+
         return result
-        
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching investors: {e}")
         raise HTTPException(status_code=500, detail="Error fetching investors")
@@ -1,95 +1,200 @@
 from PyPDF2 import PdfReader
 import fitz  # PyMuPDF
 import pdfplumber
+import asyncio
 import io
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 from .logger import logger
 from .exceptions import PDFProcessingError
 
+# Extracted text shorter than this is treated as a failed extraction
+MIN_TEXT_LENGTH = 50
+
+# Worker pool so CPU-bound parsing runs off the event loop and a library
+# crash on a malformed PDF kills a worker process, not the API
+_PDF_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _init_pool_worker():
+    """Reset logging inside a pool worker
+
+    Forked workers inherit the parent logger whose only handler is a
+    QueueHandler, but the QueueListener thread draining that queue does
+    not survive the fork — records would pile up unread and unbounded.
+    Workers log straight to stdout instead.
+    """
+    worker_logger = logging.getLogger("pitch_analyzer")
+    worker_logger.handlers.clear()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+    worker_logger.addHandler(handler)
+
+
+def start_pdf_pool():
+    """Start the PDF extraction worker pool (called at app startup)"""
+    global _PDF_POOL
+    if _PDF_POOL is None:
+        _PDF_POOL = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_pool_worker
+        )
+        logger.info(f"Started PDF extraction pool with {os.cpu_count()} workers")
+
+
+def stop_pdf_pool():
+    """Shut down the PDF extraction worker pool (called at app shutdown)"""
+    global _PDF_POOL
+    if _PDF_POOL is not None:
+        _PDF_POOL.shutdown(wait=False, cancel_futures=True)
+        _PDF_POOL = None
+        logger.info("Stopped PDF extraction pool")
+
+
+def _extract_pypdf2(file_content: bytes) -> Optional[str]:
+    """Extract text with PyPDF2; returns None if nothing usable was found"""
+    pdf_reader = PdfReader(io.BytesIO(file_content))
+
+    if pdf_reader.is_encrypted:
+        raise PDFProcessingError("PDF is encrypted and cannot be processed")
+
+    text_parts = []
+    for page_num, page in enumerate(pdf_reader.pages, 1):
+        try:
+            page_text = page.extract_text()
+            if page_text and page_text.strip():
+                text_parts.append(page_text)
+                logger.debug(f"Extracted {len(page_text)} characters from page {page_num}")
+        except Exception as e:
+            logger.warning(f"Could not extract text from page {page_num} with PyPDF2: {e}")
+
+    text = "\n".join(text_parts).strip()
+    return text if len(text) > MIN_TEXT_LENGTH else None
+
+
+def _extract_fitz(file_content: bytes) -> Optional[str]:
+    """Extract text with PyMuPDF; returns None if nothing usable was found"""
+    doc = fitz.open(stream=file_content, filetype="pdf")
+
+    try:
+        text_parts = []
+        for page_num in range(doc.page_count):
+            try:
+                page = doc[page_num]
+                page_text = page.get_text()
+                if page_text and page_text.strip():
+                    text_parts.append(page_text)
+                    logger.debug(f"Extracted {len(page_text)} characters from page {page_num + 1}")
+            except Exception as e:
+                logger.warning(f"Could not extract text from page {page_num + 1} with PyMuPDF: {e}")
+
+        text = "\n".join(text_parts).strip()
+        if len(text) > MIN_TEXT_LENGTH:
+            return text
+
+        # No text but embedded images: this is a scanned/image-only PDF and
+        # the pure-Python extractors will come up empty too, so fail fast
+        if any(doc[page_num].get_images() for page_num in range(doc.page_count)):
+            raise PDFProcessingError(
+                "PDF appears to be image-only (scanned); no extractable text found"
+            )
+
+        return None
+    finally:
+        doc.close()
+
+
+def _extract_plumber(file_content: bytes) -> Optional[str]:
+    """Extract text with pdfplumber; returns None if nothing usable was found"""
+    with pdfplumber.open(io.BytesIO(file_content)) as pdf:
+        text_parts = []
+        for page_num, page in enumerate(pdf.pages, 1):
+            try:
+                page_text = page.extract_text()
+                if page_text and page_text.strip():
+                    text_parts.append(page_text)
+                    logger.debug(f"Extracted {len(page_text)} characters from page {page_num}")
+            except Exception as e:
+                logger.warning(f"Could not extract text from page {page_num} with pdfplumber: {e}")
+
+        text = "\n".join(text_parts).strip()
+        return text if len(text) > MIN_TEXT_LENGTH else None
+
+
+# PyMuPDF (C-backed MuPDF) leads: it is typically several times faster than
+# the pure-Python extractors on text-bearing pages and its verdict on
+# image-only PDFs is authoritative
+_EXTRACTORS = [
+    ("PyMuPDF", _extract_fitz),
+    ("PyPDF2", _extract_pypdf2),
+    ("pdfplumber", _extract_plumber),
+]
+
 
 class PDFProcessor:
     @staticmethod
     async def extract_text_from_pdf(file_content: bytes, filename: str = "unknown") -> str:
-        """Extract text from PDF using multiple fallback methods"""
-        logger.info(f"Starting PDF text extraction for file: {filename}") 
-        
-        #method 1: PyPDF
-        
-        try:
-            logger.debug("Attempting text extraction with PyPDF2")
-            pdf_reader = PdfReader(io.BytesIO(file_content))
-            
-            if pdf_reader.is_encrypted:
-                raise PDFProcessingError("PDF is encrypted and cannot be processed")
-            
-            text_parts = []
-            for page_num, page in enumerate(pdf_reader.pages, 1):
-                try:
-                    page_text = page.extract_text()
-                    if page_text and page_text.strip():
-                        text_parts.append(page_text)
-                        logger.debug(f"Extracted {len(page_text)} characters from page {page_num}")
-                except Exception as e:
-                    logger.warning(f"Could not extract text from page {page_num} with PyPDF2: {e}")
-                    
-            text = "\n".join(text_parts).strip()
-            if text and len(text) > 50:  # Reasonable minimum
-                logger.info(f"Successfully extracted {len(text)} characters using PyPDF2")
-                return text
-                
-        except Exception as e:
-            logger.warning(f"PyPDF2 extraction failed for {filename}: {e}")
-            
-            
-        #method 2: PyMuPDF
-        try:
-            logger.debug("Attempting text extraction with PyMuPDF")
-            doc = fitz.open(stream=file_content, filetype="pdf")
-            
-            text_parts = []
-            for page_num in range(doc.page_count):
-                try:
-                    page = doc[page_num]
-                    page_text = page.get_text()
-                    if page_text and page_text.strip():
-                        text_parts.append(page_text)
-                        logger.debug(f"Extracted {len(page_text)} characters from page {page_num + 1}")
-                except Exception as e:
-                    logger.warning(f"Could not extract text from page {page_num + 1} with PyMuPDF: {e}")
-            
-            doc.close()
-            text = "\n".join(text_parts).strip()
-            if text and len(text) > 50:
-                logger.info(f"Successfully extracted {len(text)} characters using PyMuPDF")
-                return text
-                
-        except Exception as e:
-            logger.warning(f"PyMuPDF extraction failed for {filename}: {e}")
-        
-        # Method 3: pdfplumber
+        """Extract text from PDF, racing the available extractors concurrently
+
+        All three libraries run on threads at once and the first result that
+        passes the length check wins; the remaining tasks are cancelled. For
+        a good PDF this caps latency at the fastest library instead of
+        paying for each serial attempt.
+        """
+        logger.info(f"Starting PDF text extraction for file: {filename}")
+
+        if _PDF_POOL is not None:
+            # Separate processes: escapes the GIL and isolates segfaults in
+            # the parsing libraries
+            loop = asyncio.get_running_loop()
+            tasks = {
+                asyncio.ensure_future(loop.run_in_executor(_PDF_POOL, extract, file_content)): name
+                for name, extract in _EXTRACTORS
+            }
+        else:
+            # Pool not started (e.g. tests) — fall back to threads
+            tasks = {
+                asyncio.create_task(asyncio.to_thread(extract, file_content)): name
+                for name, extract in _EXTRACTORS
+            }
+
+        processing_error: Optional[PDFProcessingError] = None
+        pending = set(tasks)
         try:
-            logger.debug("Attempting text extraction with pdfplumber")
-            with pdfplumber.open(io.BytesIO(file_content)) as pdf:
-                text_parts = []
-                for page_num, page in enumerate(pdf.pages, 1):
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = tasks[task]
                     try:
-                        page_text = page.extract_text()
-                        if page_text and page_text.strip():
-                            text_parts.append(page_text)
-                            logger.debug(f"Extracted {len(page_text)} characters from page {page_num}")
+                        text = task.result()
+                    except PDFProcessingError as e:
+                        # PyMuPDF's verdict (encrypted / image-only) is
+                        # authoritative — the other extractors would come up
+                        # empty too, so don't wait for them
+                        if name == "PyMuPDF":
+                            raise
+                        # Otherwise remember it in case no extractor succeeds
+                        processing_error = e
+                        continue
                     except Exception as e:
-                        logger.warning(f"Could not extract text from page {page_num} with pdfplumber: {e}")
-                
-                text = "\n".join(text_parts).strip()
-                if text and len(text) > 50:
-                    logger.info(f"Successfully extracted {len(text)} characters using pdfplumber")
-                    return text
-                    
-        except Exception as e:
-            logger.warning(f"pdfplumber extraction failed for {filename}: {e}")
-        
+                        logger.warning(f"{name} extraction failed for {filename}: {e}")
+                        continue
+
+                    if text:
+                        logger.info(f"Successfully extracted {len(text)} characters using {name}")
+                        return text
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if processing_error:
+            raise processing_error
+
         # If all methods failed
         raise PDFProcessingError(
             f"Could not extract text from PDF '{filename}' using any available method. "
             "The PDF might be image-based, corrupted, or have complex formatting."
-        )
\ No newline at end of file
+        )
@@ -1,71 +1,293 @@
-from langchain_openai import ChatOpenAI
-from langchain.prompts import PromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
 from dotenv import load_dotenv
+import httpx
+import orjson
 from .schema import PitchFeedback
 from .config import settings
 from .logger import logger
 from .exceptions import AnalysisError
+from .semantic_cache import SemanticCache
+import asyncio
+import copy
+import functools
+import hashlib
+import pathlib
+import random
+import re
 import time
-import uuid
-from typing import Dict, Any
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 load_dotenv()
 
+# One long-lived HTTP client shared by every LLM call: connections are
+# reused and TLS handshakes amortized, and the pool is sized well above
+# httpx's default 100-connection cap so concurrent analyses don't stall
+_http_async_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=2000, max_keepalive_connections=1500),
+    timeout=httpx.Timeout(60.0)
+)
+
+
+async def close_http_client():
+    """Close the shared LLM HTTP client (called at app shutdown)"""
+    await _http_async_client.aclose()
+
+
+# Entries kept in the exact-match analysis cache
+EXACT_CACHE_MAX_ENTRIES = 1024
+
+_CODE_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+# Compiled once: each stat is one linear scan with no intermediate lists,
+# unlike the str.split passes these replaced
+_WORD_RE = re.compile(r"\S+")
+_SENTENCE_RE = re.compile(r"[^.!?]+[.!?]")
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+
+
+def _strip_code_fences(raw: str) -> str:
+    """Remove a surrounding markdown code fence from an LLM response"""
+    return _CODE_FENCE_RE.sub("", raw.strip())
+
+
+def _new_analysis_id() -> str:
+    """Generate a time-sortable analysis id
+
+    uuid4 pulls 16 bytes from os.urandom — a syscall per request. A
+    nanosecond timestamp plus 48 PRNG bits is collision-safe for tracing
+    ids, costs no syscall, and sorts chronologically in logs.
+    """
+    return f"{time.time_ns():x}{random.getrandbits(48):012x}"
+
+
+@functools.lru_cache(maxsize=1)
+def _load_base_prompt() -> str:
+    """Read prompt/prompt.txt once per process"""
+    return pathlib.Path("prompt/prompt.txt").read_text(encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=1)
+def _format_instructions() -> str:
+    """Render the PitchFeedback format instructions once per process
+
+    get_format_instructions() walks the nested PitchFeedback schema and
+    serializes it to a large JSON string; memoizing it makes analyzer
+    re-instantiation free. Imported lazily to keep module load light.
+    """
+    from langchain_core.output_parsers import PydanticOutputParser
+    return PydanticOutputParser(pydantic_object=PitchFeedback).get_format_instructions()
+
+
+# Everything before this marker in prompt.txt is static instructions;
+# the pitch-embedding stanza after it moves to the human message
+_PITCH_MARKER = "The pitch deck is provided below"
+
+# Appended to the base prompt from prompt.txt
+_EXTRA_REQUIREMENTS = """
+
+Additional Analysis Requirements:
+- Provide content statistics (word count, sentence count, paragraph count)
+- Identify top 3 risk factors
+- List top 3 strengths
+- Ensure all scores are between 0-100
+- Be specific and actionable in feedback
+- Include analysis_id and processing metadata
+
+Respond ONLY in JSON format:
+{format_instructions}
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _system_prompt() -> str:
+    """Build the fully rendered system message once per process
+
+    Keeps only the static instructions in the system message: the pitch
+    goes in the human message, so the system prefix is byte-identical
+    across requests and the provider can serve it from its prompt cache
+    instead of re-processing it every call.
+    """
+    base_prompt = _load_base_prompt()
+    marker = base_prompt.find(_PITCH_MARKER)
+    if marker != -1:
+        base_prompt = base_prompt[:marker]
+    else:
+        base_prompt = base_prompt.replace("{pitch}", "")
+
+    return (base_prompt + _EXTRA_REQUIREMENTS).replace(
+        "{format_instructions}", _format_instructions()
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _batch_system_prompt() -> str:
+    """Batched variant: system instructions plus an array-output directive"""
+    return _system_prompt() + (
+        "\n\nYou are analyzing multiple independent pitch decks in this request. "
+        "Respond ONLY with a JSON array containing one analysis object per pitch, "
+        "in the same order as the numbered pitches."
+    )
 
 
 class PitchAnalyzer:
     def __init__(self):
+        # Imported here rather than at module load: the LangChain/OpenAI
+        # stack takes hundreds of ms to import and build schemas, and the
+        # investor endpoints never need it
+        from langchain_openai import ChatOpenAI
+
         self.llm = ChatOpenAI(
             model_name=settings.openai_model,
             temperature=0,
             max_tokens=4000,
-            request_timeout=60
+            request_timeout=60,
+            http_async_client=_http_async_client
         )
-        self.parser = PydanticOutputParser(pydantic_object=PitchFeedback)
+        self.semantic_cache = SemanticCache()
         self._load_prompt_template()
+
+        # Micro-batching: pitches arriving within the collection window
+        # share one LLM request (started lazily — needs a running loop)
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
+        # Strong references to in-flight dispatch tasks; the event loop
+        # only keeps weak ones, so an unreferenced task can be collected
+        # mid-run and strand every future in its batch
+        self._dispatch_tasks: set = set()
+
+        # Exact-match LRU: with temperature=0 the response for identical
+        # input is deterministic, so replaying it is safe
+        self._exact_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
     
+    # The human message is just prefix + pitch + suffix; no template
+    # rendering needed per request
+    _HUMAN_PREFIX = 'Pitch deck content, surrounded by triple quotes:\n"""\n'
+    _HUMAN_SUFFIX = '\n"""'
+
     def _load_prompt_template(self):
-        """Load and prepare the prompt template"""
+        """Bind the precomputed prompt strings"""
         try:
-            with open("prompt/prompt.txt", "r", encoding="utf-8") as file:
-                base_prompt = file.read()
+            self._system_text = _system_prompt()
+            self._batch_system = _batch_system_prompt()
         except FileNotFoundError:
             logger.error("Prompt template file not found")
             raise AnalysisError("Prompt template configuration error")
         except Exception as e:
             logger.error(f"Error loading prompt template: {e}")
             raise AnalysisError("Failed to load analysis configuration")
-        
-        # Enhanced prompt with additional instructions
-        enhanced_prompt = base_prompt + """
+    
+    async def _invoke_single(self, pitch_content: str) -> PitchFeedback:
+        """Run one pitch through the LLM, streaming the response
 
-Additional Analysis Requirements:
-- Provide content statistics (word count, sentence count, paragraph count)
-- Identify top 3 risk factors
-- List top 3 strengths
-- Ensure all scores are between 0-100
-- Be specific and actionable in feedback
-- Include analysis_id and processing metadata
+        Streaming keeps tokens flowing over the connection as they are
+        generated instead of buffering the whole completion server-side,
+        so network stalls surface immediately and per-chunk timeouts
+        apply rather than one long dead wait.
+        """
+        chunks: List[str] = []
+        async for chunk in self.llm.astream([
+            ("system", self._system_text),
+            ("human", self._HUMAN_PREFIX + pitch_content + self._HUMAN_SUFFIX)
+        ]):
+            if chunk.content:
+                chunks.append(chunk.content)
+        data = orjson.loads(_strip_code_fences("".join(chunks)))
+        return PitchFeedback.model_validate(data)
 
-Pitch deck content:
-{pitch}
+    async def _invoke_batch(self, batch: List[Tuple[str, asyncio.Future]]):
+        """Analyze a collected batch with a single LLM request
+
+        Falls back to individual calls if the combined request fails or
+        returns the wrong number of analyses.
+        """
+        if len(batch) == 1:
+            pitch, future = batch[0]
+            try:
+                result = await self._invoke_single(pitch)
+                if not future.done():
+                    future.set_result(result)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        try:
+            numbered = "\n\n".join(
+                f'Pitch {i}, surrounded by triple quotes:\n"""\n{pitch}\n"""'
+                for i, (pitch, _) in enumerate(batch, 1)
+            )
+            response = await self.llm.ainvoke([
+                ("system", self._batch_system),
+                ("human", numbered)
+            ])
+            items = orjson.loads(_strip_code_fences(response.content))
+            if not isinstance(items, list) or len(items) != len(batch):
+                raise AnalysisError(
+                    f"Batched analysis returned {len(items) if isinstance(items, list) else 'non-list'} "
+                    f"results for {len(batch)} pitches"
+                )
+            results = [PitchFeedback.model_validate(item) for item in items]
+        except Exception as e:
+            logger.warning(f"Batched analysis of {len(batch)} pitches failed, falling back to single calls: {e}")
+            for pitch, future in batch:
+                # A caller may have gone away (client disconnect) — its
+                # future is cancelled and setting it would raise, leaving
+                # the rest of the batch unresolved
+                if future.done():
+                    continue
+                try:
+                    result = await self._invoke_single(pitch)
+                    if not future.done():
+                        future.set_result(result)
+                except Exception as single_error:
+                    if not future.done():
+                        future.set_exception(single_error)
+            return
+
+        logger.info(f"Analyzed {len(batch)} pitches in one LLM request")
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _batch_worker(self):
+        """Collect pitches for up to the batch window, then dispatch them"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._batch_queue.get()]
+            deadline = loop.time() + settings.analysis_batch_wait_ms / 1000
+            while len(batch) < settings.analysis_batch_max:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._batch_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Dispatch without blocking collection of the next batch,
+            # holding a reference until the task finishes
+            task = asyncio.create_task(self._invoke_batch(batch))
+            self._dispatch_tasks.add(task)
+            task.add_done_callback(self._dispatch_tasks.discard)
+
+    async def _request_feedback(self, pitch_content: str) -> PitchFeedback:
+        """Get feedback for one pitch, coalescing concurrent requests"""
+        if not settings.analysis_batching_enabled:
+            return await self._invoke_single(pitch_content)
+
+        if self._batch_task is None or self._batch_task.done():
+            self._batch_queue = asyncio.Queue()
+            self._batch_task = asyncio.create_task(self._batch_worker())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._batch_queue.put((pitch_content, future))
+        return await future
 
-Respond ONLY in JSON format:
-{format_instructions}
-"""
-        
-        self.prompt = PromptTemplate(
-            template=enhanced_prompt,
-            input_variables=["pitch"],
-            partial_variables={"format_instructions": self.parser.get_format_instructions()}
-        )
-    
     def _calculate_content_stats(self, content: str) -> Dict[str, Any]:
         """Calculate basic content statistics"""
-        words = len(content.split())
-        sentences = len([s for s in content.split('.') if s.strip()])
-        paragraphs = len([p for p in content.split('\n\n') if p.strip()])
+        has_content = bool(content) and not content.isspace()
+        words = sum(1 for _ in _WORD_RE.finditer(content))
+        sentences = sum(1 for _ in _SENTENCE_RE.finditer(content)) or (1 if has_content else 0)
+        paragraphs = sum(1 for _ in _PARAGRAPH_BREAK_RE.finditer(content)) + 1 if has_content else 0
         characters = len(content)
         
         return {
@@ -80,37 +302,65 @@ Respond ONLY in JSON format:
 
     async def analyze_pitch(self, pitch_content: str) -> dict:
         """Analyze pitch content and return structured feedback"""
-        start_time = time.time()
-        analysis_id = str(uuid.uuid4())
+        start_time = time.perf_counter()
+        analysis_id = _new_analysis_id()
         
         logger.info(f"Starting pitch analysis {analysis_id}")
-        
+
         try:
+            # Byte-identical pitches replay the cached result directly
+            exact_key = hashlib.sha256(pitch_content.encode()).hexdigest()
+            exact_hit = self._exact_cache.get(exact_key)
+            if exact_hit is not None:
+                self._exact_cache.move_to_end(exact_key)
+                result_dict = copy.deepcopy(exact_hit)
+                result_dict["analysis_id"] = analysis_id
+                result_dict["processing_time"] = round(time.perf_counter() - start_time, 2)
+                logger.info(f"Analysis {analysis_id} served from exact cache")
+                return result_dict
+
+            # Near-identical pitches skip the LLM entirely (embedding off
+            # the event loop — it's CPU-bound)
+            cached = await asyncio.to_thread(self.semantic_cache.get, pitch_content)
+            if cached is not None:
+                result_dict = copy.deepcopy(cached)
+                result_dict["analysis_id"] = analysis_id
+                result_dict["processing_time"] = round(time.perf_counter() - start_time, 2)
+                logger.info(f"Analysis {analysis_id} served from semantic cache")
+                return result_dict
+
             # Calculate content statistics
             content_stats = self._calculate_content_stats(pitch_content)
             logger.debug(f"Content stats: {content_stats}")
-            
-            # Create the chain and invoke analysis
-            chain = self.prompt | self.llm | self.parser
-            
+
             logger.debug("Invoking AI analysis chain")
-            result = await chain.ainvoke({"pitch": pitch_content})
-            
+            result = await self._request_feedback(pitch_content)
+
             # Add metadata
             result.analysis_id = analysis_id
-            result.processing_time = round(time.time() - start_time, 2)
+            result.processing_time = round(time.perf_counter() - start_time, 2)
             result.content_statistics = content_stats
-            
+
             logger.info(f"Analysis {analysis_id} completed in {result.processing_time}s")
-            
-            return result.dict()
+
+            result_dict = result.model_dump(mode="python")
+
+            self._exact_cache[exact_key] = result_dict
+            while len(self._exact_cache) > EXACT_CACHE_MAX_ENTRIES:
+                self._exact_cache.popitem(last=False)
+
+            await asyncio.to_thread(self.semantic_cache.put, pitch_content, result_dict)
+            return result_dict
             
         except Exception as e:
-            processing_time = round(time.time() - start_time, 2)
+            processing_time = round(time.perf_counter() - start_time, 2)
             logger.error(f"Analysis {analysis_id} failed after {processing_time}s: {str(e)}")
             raise AnalysisError(f"AI analysis failed: {str(e)}")
 
-pitch_analyzer = PitchAnalyzer()
+@functools.lru_cache(maxsize=1)
+def get_pitch_analyzer() -> PitchAnalyzer:
+    """Return the shared analyzer, constructing it on first use"""
+    return PitchAnalyzer()
 
 
 
@@ -0,0 +1,97 @@
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from .config import settings
+from .logger import logger
+
+
+class SemanticCache:
+    """Embedding-similarity cache for pitch analysis results
+
+    Stores (embedding, result dict) pairs and serves a stored result when a
+    new pitch embeds within the similarity threshold of a cached one, so
+    paraphrased or lightly edited pitches skip the LLM round-trip entirely.
+
+    The embedding model (sentence-transformers) is loaded lazily on first
+    use; if the package is not installed the cache disables itself and every
+    lookup is a miss.
+    """
+
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        threshold: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.model_name = model_name or settings.semantic_cache_model
+        self.threshold = threshold if threshold is not None else settings.semantic_cache_threshold
+        self.max_entries = max_entries or settings.semantic_cache_max_entries
+        self._model = None
+        self._np = None
+        self._disabled = not settings.semantic_cache_enabled
+        # Insertion-ordered for LRU eviction; values are (embedding, result)
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+
+    def _ensure_model(self) -> bool:
+        """Load the embedding model on first use; disable on failure"""
+        if self._disabled:
+            return False
+        if self._model is not None:
+            return True
+
+        try:
+            import numpy as np
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            logger.warning(
+                "sentence-transformers not installed; semantic cache disabled"
+            )
+            self._disabled = True
+            return False
+
+        try:
+            self._model = SentenceTransformer(self.model_name)
+            self._np = np
+            logger.info(f"Semantic cache ready (model={self.model_name}, threshold={self.threshold})")
+            return True
+        except Exception as e:
+            logger.warning(f"Could not load semantic cache model: {e}")
+            self._disabled = True
+            return False
+
+    def _embed(self, text: str):
+        """Embed and L2-normalize so dot product equals cosine similarity"""
+        vector = self._model.encode(text.strip().lower())
+        norm = self._np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, text: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for the most similar pitch, if close enough"""
+        if not self._ensure_model() or not self._entries:
+            return None
+
+        query = self._embed(text)
+        best_key = None
+        best_score = self.threshold
+        for key, (embedding, _) in self._entries.items():
+            score = float(self._np.dot(query, embedding))
+            if score >= best_score:
+                best_score = score
+                best_key = key
+
+        if best_key is None:
+            return None
+
+        # Refresh LRU position on hit
+        embedding, result = self._entries.pop(best_key)
+        self._entries[best_key] = (embedding, result)
+        logger.info(f"Semantic cache hit (similarity={best_score:.3f})")
+        return result
+
+    def put(self, text: str, result: Dict[str, Any]) -> None:
+        """Store an analysis result under the pitch's embedding"""
+        if not self._ensure_model():
+            return
+
+        self._entries[text[:256]] = (self._embed(text), result)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)